@@ -31,41 +31,132 @@ Examples:
     python build_custom_image.py --dry-run
 """
 
-import argparse
+import heapq
 import json
-import logging
 import os
+import shutil
 import subprocess
 import sys
 import time
 from base64 import b64encode
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import argparse
+    import logging
+
+# orjson is optional; fall back to the standard library when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Persistent cache for results that are expensive to recompute between runs
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', '~/.cache')).expanduser() / 'frappe_builder'
+PREREQ_CACHE_FILE = CACHE_DIR / 'prereq.json'
+APPS_CACHE_FILE = CACHE_DIR / 'apps_cache'
+PREREQ_CACHE_TTL = 60  # seconds a successful Docker daemon check is trusted
+
+# Warn when a build context without .dockerignore is larger than this
+BUILD_CONTEXT_WARN_BYTES = 50 * 1024 * 1024
+
+# Longest time to wait for background image pulls before starting the build
+PREPULL_WAIT_TIMEOUT = 300  # seconds
+
+# Formatted status timestamp, recomputed at most once per second
+_last_ts_sec = 0
+_last_ts_str = ''
+
+def _tree_size(path: str) -> int:
+    """Return the total size in bytes of the files below path, without following symlinks"""
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total += _tree_size(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return total
+
+def _status_timestamp() -> str:
+    """Return the current wall-clock time as HH:MM:SS, cached per second"""
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_sec = now
+        _last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+    return _last_ts_str
+
+# Color codes for beautiful output, disabled for non-terminals and NO_COLOR
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
 
-# Color codes for beautiful output
 class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+    HEADER = '\033[95m' if _USE_COLOR else ''
+    OKBLUE = '\033[94m' if _USE_COLOR else ''
+    OKCYAN = '\033[96m' if _USE_COLOR else ''
+    OKGREEN = '\033[92m' if _USE_COLOR else ''
+    WARNING = '\033[93m' if _USE_COLOR else ''
+    FAIL = '\033[91m' if _USE_COLOR else ''
+    ENDC = '\033[0m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    UNDERLINE = '\033[4m' if _USE_COLOR else ''
+
+    # Encoded variants for byte-oriented output
+    HEADER_B = HEADER.encode()
+    OKBLUE_B = OKBLUE.encode()
+    OKCYAN_B = OKCYAN.encode()
+    OKGREEN_B = OKGREEN.encode()
+    WARNING_B = WARNING.encode()
+    FAIL_B = FAIL.encode()
+    ENDC_B = ENDC.encode()
+    BOLD_B = BOLD.encode()
+    UNDERLINE_B = UNDERLINE.encode()
 
 class FrappeImageBuilder:
     """Main class for building Frappe Docker images"""
     
+    REQUIRED_FILES = [
+        'images/layered/Containerfile',
+        'images/custom/Containerfile'
+    ]
+    
+    STATUS_COLORS = {
+        "INFO": Colors.OKBLUE,
+        "SUCCESS": Colors.OKGREEN,
+        "WARNING": Colors.WARNING,
+        "ERROR": Colors.FAIL,
+        "HEADER": Colors.HEADER
+    }
+    
+    # Precomputed status line framing, written around each message
+    _STATUS_PREFIX = {status: color + '[' for status, color in STATUS_COLORS.items()}
+    _STATUS_SUFFIX = Colors.ENDC + '\n'
+    
     def __init__(self):
         self.config = {}
-        self.logger = self._setup_logging()
+        self._logger = None
         self.start_time = None
         self.temp_files = []
+        self.prepull_processes = []
         
-    def _setup_logging(self) -> logging.Logger:
+    @property
+    def logger(self) -> 'logging.Logger':
+        """Logger, configured on first use so --help does not pay for it"""
+        if self._logger is None:
+            self._logger = self._setup_logging()
+        return self._logger
+    
+    def _setup_logging(self) -> 'logging.Logger':
         """Setup logging configuration"""
+        import logging
+        
         handlers = [logging.StreamHandler()]
         
         # Try to add file handler, but don't fail if we can't create the log file
@@ -102,54 +193,211 @@ class FrappeImageBuilder:
     
     def _print_status(self, message: str, status: str = "INFO"):
         """Print formatted status messages"""
-        color_map = {
-            "INFO": Colors.OKBLUE,
-            "SUCCESS": Colors.OKGREEN,
-            "WARNING": Colors.WARNING,
-            "ERROR": Colors.FAIL,
-            "HEADER": Colors.HEADER
+        prefix = self._STATUS_PREFIX.get(status, self._STATUS_PREFIX["INFO"])
+        sys.stdout.write(prefix + _status_timestamp() + '] ' + message + self._STATUS_SUFFIX)
+        
+    def _stat_required_files(self) -> Optional[Dict[str, List[int]]]:
+        """Return (mtime_ns, size) for each required file, or None if any is missing"""
+        stats = {}
+        for file_path in self.REQUIRED_FILES:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None
+            stats[file_path] = [st.st_mtime_ns, st.st_size]
+        return stats
+    
+    def _docker_target(self) -> Dict[str, Optional[str]]:
+        """Return the environment that selects which Docker daemon is used"""
+        return {
+            'docker_host': os.environ.get('DOCKER_HOST'),
+            'docker_context': os.environ.get('DOCKER_CONTEXT')
+        }
+    
+    def _read_prereq_cache(self, file_stats: Dict[str, List[int]]) -> Optional[str]:
+        """Return the cached Docker version if the prerequisite cache is still valid"""
+        try:
+            with open(PREREQ_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # Anything unexpected in the cache is treated as a miss
+        if not isinstance(cache, dict):
+            return None
+        daemon_ok_ts = cache.get('daemon_ok_ts')
+        if not isinstance(daemon_ok_ts, (int, float)) or isinstance(daemon_ok_ts, bool):
+            return None
+        if not 0 <= time.time() - daemon_ok_ts <= PREREQ_CACHE_TTL:
+            return None
+        files = cache.get('files')
+        if not isinstance(files, dict) or files != file_stats:
+            return None
+        if cache.get('docker_target') != self._docker_target():
+            return None
+        docker_version = cache.get('docker_version')
+        return docker_version if isinstance(docker_version, str) and docker_version else None
+    
+    def _write_prereq_cache(self, docker_version: str, file_stats: Dict[str, List[int]]):
+        """Record a successful prerequisite check"""
+        cache = {
+            'docker_version': docker_version,
+            'daemon_ok_ts': time.time(),
+            'docker_target': self._docker_target(),
+            'files': file_stats
         }
-        color = color_map.get(status, Colors.OKBLUE)
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"{color}[{timestamp}] {message}{Colors.ENDC}")
+        try:
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(PREREQ_CACHE_FILE, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            self.logger.debug(f"Could not write prerequisite cache: {e}")
+    
+    def _apps_cache_key(self, apps_file: str) -> Optional[str]:
+        """Return a cache key identifying the current contents of the apps file"""
+        try:
+            st = os.stat(apps_file)
+        except OSError:
+            return None
+        return f"{os.path.abspath(apps_file)}:{st.st_mtime_ns}:{st.st_size}"
+    
+    def _read_apps_cache(self, key: str) -> Optional[str]:
+        """Return the cached base64 apps configuration if it matches key"""
+        try:
+            with open(APPS_CACHE_FILE, 'r') as f:
+                cached_key = f.readline().rstrip('\n')
+                if cached_key != key:
+                    return None
+                cached_base64 = f.readline().rstrip('\n')
+        except (OSError, ValueError):
+            # Unreadable or undecodable cache is just a miss
+            return None
+        return cached_base64 or None
+    
+    def _write_apps_cache(self, key: str, apps_json_base64: str):
+        """Atomically store the base64 apps configuration under key
         
+        App URLs may embed access tokens, so the cache is only readable by its owner.
+        """
+        tmp_file = APPS_CACHE_FILE.with_name(f"{APPS_CACHE_FILE.name}.{os.getpid()}.tmp")
+        try:
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'w') as f:
+                f.write(f"{key}\n{apps_json_base64}\n")
+            os.replace(tmp_file, APPS_CACHE_FILE)
+        except OSError as e:
+            self.logger.debug(f"Could not write apps cache: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    
     def _validate_prerequisites(self) -> bool:
         """Validate system prerequisites"""
         self._print_status("🔍 Validating prerequisites...", "INFO")
         
-        # Check Docker
-        try:
-            result = subprocess.run(['docker', '--version'], capture_output=True, text=True)
+        # Reuse a recent successful check if the Containerfiles are unchanged
+        file_stats = self._stat_required_files()
+        docker_version = self._read_prereq_cache(file_stats) if file_stats else None
+        if docker_version:
+            self._print_status(f"✅ Docker: {docker_version} (cached)", "SUCCESS")
+        elif not self._check_docker_and_files():
+            return False
+        
+        # Check buildx builder
+        if self.config['buildx_cache_ref']:
+            result = subprocess.run(
+                ['docker', 'buildx', 'inspect', '--bootstrap'],
+                capture_output=True,
+                text=True,
+                close_fds=False
+            )
             if result.returncode != 0:
-                self._print_status("❌ Docker is not installed or not accessible", "ERROR")
+                self._print_status("❌ Docker buildx builder is not available", "ERROR")
                 return False
-            self._print_status(f"✅ Docker: {result.stdout.strip()}", "SUCCESS")
-        except FileNotFoundError:
+            
+            # The default docker driver cannot export a registry cache
+            driver = None
+            for line in result.stdout.splitlines():
+                key, _, value = line.partition(':')
+                if key.strip() == 'Driver':
+                    driver = value.strip()
+                    break
+            if driver == 'docker':
+                self._print_status(
+                    "❌ The active buildx builder uses the 'docker' driver, which cannot export a registry cache",
+                    "ERROR"
+                )
+                self._print_status(
+                    "   Create one with: docker buildx create --use --driver docker-container",
+                    "INFO"
+                )
+                return False
+        
+        self._print_status("✅ All prerequisites validated", "SUCCESS")
+        return True
+    
+    def _check_docker_and_files(self) -> bool:
+        """Check Docker, the Docker daemon and required files, caching the result"""
+        # Check Docker is on PATH without spawning it
+        docker_bin = shutil.which('docker')
+        if docker_bin is None:
             self._print_status("❌ Docker command not found", "ERROR")
             return False
         
-        # Check Docker daemon
+        # Check the Docker daemon, and the Docker version unless in quiet mode.
+        # Python fds are non-inheritable by default, so close_fds=False is safe
+        # and lets subprocess use the faster posix_spawn/vfork path.
+        version_process = None
+        info_process = None
         try:
-            result = subprocess.run(['docker', 'info'], capture_output=True, text=True)
-            if result.returncode != 0:
-                self._print_status("❌ Docker daemon is not running", "ERROR")
-                return False
+            if not self.config.get('quiet'):
+                version_process = subprocess.Popen(
+                    [docker_bin, '--version'],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    close_fds=False
+                )
+            info_process = subprocess.Popen(
+                [docker_bin, 'info'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+            
+            version_output = version_process.communicate()[0] if version_process else ''
+            info_process.wait()
         except Exception as e:
+            # Don't leave an already started check running
+            for process in (version_process, info_process):
+                if process is not None and process.poll() is None:
+                    process.kill()
+                    process.wait()
             self._print_status(f"❌ Docker daemon check failed: {e}", "ERROR")
             return False
         
-        # Check required files
-        required_files = [
-            'images/layered/Containerfile',
-            'images/custom/Containerfile'
-        ]
+        if version_process and version_process.returncode != 0:
+            self._print_status("❌ Docker is not installed or not accessible", "ERROR")
+            return False
+        docker_version = version_output.strip()
+        if docker_version:
+            self._print_status(f"✅ Docker: {docker_version}", "SUCCESS")
         
-        for file_path in required_files:
+        if info_process.returncode != 0:
+            self._print_status("❌ Docker daemon is not running", "ERROR")
+            return False
+        
+        # Check required files
+        for file_path in self.REQUIRED_FILES:
             if not Path(file_path).exists():
                 self._print_status(f"❌ Required file missing: {file_path}", "ERROR")
                 return False
         
-        self._print_status("✅ All prerequisites validated", "SUCCESS")
+        # Quiet runs skip the version check, so there is nothing complete to cache
+        if docker_version:
+            self._write_prereq_cache(docker_version, self._stat_required_files())
         return True
     
     def _load_apps_config(self, apps_file: str) -> List[Dict]:
@@ -157,31 +405,37 @@ class FrappeImageBuilder:
         self._print_status(f"📄 Loading apps configuration from {apps_file}...", "INFO")
         
         try:
-            with open(apps_file, 'r') as f:
-                apps_config = json.load(f)
+            if orjson:
+                with open(apps_file, 'rb') as f:
+                    apps_config = orjson.loads(f.read())
+            else:
+                with open(apps_file, 'r') as f:
+                    apps_config = json.load(f)
             
             # Validate apps configuration
             if not isinstance(apps_config, list):
                 raise ValueError("Apps configuration must be a JSON array")
             
+            # Validate and list apps in a single pass
+            required = {'url', 'branch'}
+            list_apps = not self.config.get('quiet')
             for i, app in enumerate(apps_config):
                 if not isinstance(app, dict):
                     raise ValueError(f"App {i} must be a JSON object")
-                if 'url' not in app:
-                    raise ValueError(f"App {i} missing required 'url' field")
-                if 'branch' not in app:
-                    raise ValueError(f"App {i} missing required 'branch' field")
+                if not required.issubset(app):
+                    missing = [field for field in ('url', 'branch') if field not in app]
+                    raise ValueError(f"App {i} missing required '{missing[0]}' field")
+                if list_apps:
+                    self._print_status(f"   {i + 1}. {app['url']} (branch: {app['branch']})", "INFO")
             
             self._print_status(f"✅ Loaded {len(apps_config)} apps from configuration", "SUCCESS")
-            for i, app in enumerate(apps_config, 1):
-                self._print_status(f"   {i}. {app['url']} (branch: {app['branch']})", "INFO")
             
             return apps_config
             
         except FileNotFoundError:
             self._print_status(f"❌ Apps file not found: {apps_file}", "ERROR")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # also covers orjson.JSONDecodeError
             self._print_status(f"❌ Invalid JSON in apps file: {e}", "ERROR")
             sys.exit(1)
         except ValueError as e:
@@ -189,12 +443,12 @@ class FrappeImageBuilder:
             sys.exit(1)
     
     def _get_build_args(self) -> Dict[str, str]:
-        """Generate build arguments based on configuration"""
-        build_args = {
-            'FRAPPE_PATH': self.config['frappe_path'],
-            'FRAPPE_BRANCH': self.config['frappe_branch'],
-            'APPS_JSON_BASE64': self.config['apps_json_base64']
-        }
+        """Generate build arguments based on configuration
+        
+        Arguments are emitted in a stable order, with the apps payload
+        (APPS_JSON_BASE64) last.
+        """
+        build_args = {}
         
         if self.config['build_method'] == 'custom':
             build_args.update({
@@ -205,18 +459,50 @@ class FrappeImageBuilder:
                 'WKHTMLTOPDF_DISTRO': self.config['wkhtmltopdf_distro']
             })
         
+        build_args.update({
+            'FRAPPE_PATH': self.config['frappe_path'],
+            'FRAPPE_BRANCH': self.config['frappe_branch'],
+            'APPS_JSON_BASE64': self.config['apps_json_base64']
+        })
+        
         return build_args
     
     def _build_docker_command(self) -> List[str]:
         """Build the Docker command"""
         build_args = self._get_build_args()
         
-        cmd = ['docker', 'build']
+        buildx_cache_ref = self.config['buildx_cache_ref']
+        if buildx_cache_ref:
+            cmd = ['docker', 'buildx', 'build']
+        else:
+            cmd = ['docker', 'build']
         
         # Add build arguments
         for key, value in build_args.items():
             cmd.extend(['--build-arg', f'{key}={value}'])
         
+        # Add cache sources
+        cache_refs = list(self.config['cache_from'])
+        if self.config['inline_cache']:
+            if self.config['tag'] not in cache_refs:
+                cache_refs.insert(0, self.config['tag'])
+            cmd.extend(['--build-arg', 'BUILDKIT_INLINE_CACHE=1'])
+        
+        for ref in cache_refs:
+            cmd.extend(['--cache-from', ref])
+        
+        # Persist all intermediate layers in a registry cache
+        if buildx_cache_ref:
+            cmd.extend([
+                f'--cache-to=type=registry,ref={buildx_cache_ref},mode=max',
+                f'--cache-from=type=registry,ref={buildx_cache_ref}',
+                '--push' if self.config['push'] else '--load'
+            ])
+        
+        # Plain progress output avoids terminal redraw frames in captured logs
+        if not sys.stdout.isatty():
+            cmd.append('--progress=plain')
+        
         # Add tag
         cmd.extend(['--tag', self.config['tag']])
         
@@ -229,6 +515,90 @@ class FrappeImageBuilder:
         
         return cmd
     
+    def _check_build_context(self, context: str = '.'):
+        """Warn about a large build context that is not filtered by .dockerignore"""
+        if Path(context, '.dockerignore').exists():
+            return
+        
+        sizes = []
+        with os.scandir(context) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        size = _tree_size(entry.path)
+                    else:
+                        size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                sizes.append((size, entry.name))
+        
+        total = sum(size for size, _ in sizes)
+        if total <= BUILD_CONTEXT_WARN_BYTES:
+            return
+        
+        self._print_status(
+            f"⚠️  Build context is {total / 1024 / 1024:.1f} MB and has no .dockerignore; "
+            "Docker will send all of it to the daemon",
+            "WARNING"
+        )
+        for size, name in heapq.nlargest(5, sizes):
+            self._print_status(f"   {size / 1024 / 1024:8.1f} MB  {name}", "WARNING")
+    
+    def _get_prepull_refs(self) -> List[str]:
+        """Images worth pulling before the build starts"""
+        refs = []
+        
+        # A buildx container builder does not see images in the local daemon
+        if self.config['buildx_cache_ref']:
+            return refs
+        
+        if self.config['build_method'] == 'custom':
+            refs.append(f"python:{self.config['python_version']}-slim-{self.config['debian_base']}")
+        else:
+            refs.append(f"frappe/build:{self.config['frappe_branch']}")
+            refs.append(f"frappe/base:{self.config['frappe_branch']}")
+        
+        # The previous image is used as a cache source
+        if self.config['inline_cache']:
+            refs.append(self.config['tag'])
+        
+        return refs
+    
+    def _start_prepull(self):
+        """Start pulling base and cache images in the background while setup continues"""
+        refs = self._get_prepull_refs()
+        if not refs:
+            return
+        
+        self._print_status(f"📥 Pulling in background: {', '.join(refs)}", "INFO")
+        for ref in refs:
+            try:
+                self.prepull_processes.append(subprocess.Popen(
+                    ['docker', 'pull', ref],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                ))
+            except OSError as e:
+                self._print_status(f"⚠️  Could not start pull of {ref}: {e}", "WARNING")
+    
+    def _wait_for_prepull(self):
+        """Wait a bounded time for background pulls; stragglers are stopped in _cleanup"""
+        pending = [process for process in self.prepull_processes if process.poll() is None]
+        if not pending:
+            return
+        
+        self._print_status("⏳ Waiting for background image pulls...", "INFO")
+        deadline = time.monotonic() + PREPULL_WAIT_TIMEOUT
+        for process in pending:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                self._print_status(
+                    f"⚠️  Image pulls still running after {PREPULL_WAIT_TIMEOUT}s, starting build anyway",
+                    "WARNING"
+                )
+                return
+    
     def _execute_build(self, cmd: List[str]) -> bool:
         """Execute the Docker build command"""
         if self.config['dry_run']:
@@ -236,30 +606,39 @@ class FrappeImageBuilder:
             self._print_status(f"   {' '.join(cmd)}", "INFO")
             return True
         
+        # Wait for background image pulls so the build can reuse them
+        self._wait_for_prepull()
+        
         self._print_status("🔨 Starting Docker build...", "INFO")
         self._print_status(f"Command: {' '.join(cmd)}", "INFO")
         
+        env = {**os.environ, 'DOCKER_BUILDKIT': '1'}
+        
         try:
-            # Use subprocess.run with real-time output
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
-            )
-            
-            # Stream output in real-time
-            for line in iter(process.stdout.readline, ''):
-                print(f"{Colors.OKCYAN}[BUILD] {line.rstrip()}{Colors.ENDC}")
-            
-            process.wait()
+            if self.config['quiet'] or not sys.stdout.isatty():
+                # No colouring needed: let Docker write straight to our stdout
+                sys.stdout.flush()
+                returncode = subprocess.run(cmd, env=env, stderr=subprocess.STDOUT, check=False).returncode
+            else:
+                # Use subprocess.Popen with real-time output
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=0,
+                    env=env
+                )
+                
+                # Stream output in real-time
+                self._stream_build_output(process.stdout.fileno())
+                
+                returncode = process.wait()
             
-            if process.returncode == 0:
+            if returncode == 0:
                 self._print_status("✅ Docker build completed successfully!", "SUCCESS")
                 return True
             else:
-                self._print_status(f"❌ Docker build failed with exit code {process.returncode}", "ERROR")
+                self._print_status(f"❌ Docker build failed with exit code {returncode}", "ERROR")
                 return False
                 
         except KeyboardInterrupt:
@@ -269,8 +648,50 @@ class FrappeImageBuilder:
             self._print_status(f"❌ Build failed with error: {e}", "ERROR")
             return False
     
+    def _stream_build_output(self, fd: int):
+        """Copy raw build output to stdout in large blocks, prefixing each line"""
+        prefix = b'[BUILD] '
+        color = Colors.OKCYAN_B
+        endc = Colors.ENDC_B
+        out = sys.stdout.buffer
+        at_line_start = True
+        
+        # Flush pending text output so it is not interleaved with raw writes
+        sys.stdout.flush()
+        
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            
+            ends_with_newline = chunk.endswith(b'\n')
+            if ends_with_newline:
+                chunk = chunk[:-1]
+            chunk = chunk.replace(b'\n', endc + b'\n' + color + prefix)
+            if at_line_start:
+                chunk = prefix + chunk
+            chunk += endc + b'\n' if ends_with_newline else endc
+            
+            out.write(color + chunk)
+            out.flush()
+            at_line_start = ends_with_newline
+        
+        # Close a final partial line so later status output starts on its own line
+        if not at_line_start:
+            out.write(b'\n')
+            out.flush()
+    
     def _cleanup(self):
-        """Clean up temporary files"""
+        """Clean up temporary files and background processes"""
+        for process in self.prepull_processes:
+            if process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+        
         for temp_file in self.temp_files:
             try:
                 if Path(temp_file).exists():
@@ -311,8 +732,10 @@ class FrappeImageBuilder:
             node_ver = input(f"{Colors.OKBLUE}Node.js version [20.19.2]: {Colors.ENDC}").strip()
             self.config['node_version'] = node_ver if node_ver else '20.19.2'
     
-    def _parse_arguments(self) -> argparse.Namespace:
+    def _parse_arguments(self) -> 'argparse.Namespace':
         """Parse command line arguments"""
+        import argparse
+        
         parser = argparse.ArgumentParser(
             description="Build custom Frappe/ERPNext Docker images",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -386,6 +809,32 @@ Examples:
             help='wkhtmltopdf distro (default: bookworm)'
         )
         
+        parser.add_argument(
+            '--cache-from',
+            action='append',
+            default=[],
+            metavar='REF',
+            help='Image reference to use as a build cache source (can be repeated)'
+        )
+        
+        parser.add_argument(
+            '--inline-cache',
+            action='store_true',
+            help='Embed cache metadata in the image and reuse the previous tag as cache source'
+        )
+        
+        parser.add_argument(
+            '--buildx-cache-ref',
+            metavar='REF',
+            help='Registry ref for a persistent buildx layer cache (switches to docker buildx build)'
+        )
+        
+        parser.add_argument(
+            '--push',
+            action='store_true',
+            help='Push the image to its registry instead of loading it locally (buildx only)'
+        )
+        
         parser.add_argument(
             '--interactive', '-i',
             action='store_true',
@@ -410,9 +859,13 @@ Examples:
             help='Quiet mode (minimal output)'
         )
         
-        return parser.parse_args()
+        args = parser.parse_args()
+        if args.push and not args.buildx_cache_ref:
+            parser.error('--push requires --buildx-cache-ref')
+        
+        return args
     
-    def _load_config(self, args: argparse.Namespace):
+    def _load_config(self, args: 'argparse.Namespace'):
         """Load configuration from arguments and environment variables"""
         self.config = {
             'apps_file': args.apps_file,
@@ -425,6 +878,10 @@ Examples:
             'debian_base': args.debian_base,
             'wkhtmltopdf_version': args.wkhtmltopdf_version,
             'wkhtmltopdf_distro': args.wkhtmltopdf_distro,
+            'cache_from': args.cache_from,
+            'inline_cache': args.inline_cache,
+            'buildx_cache_ref': args.buildx_cache_ref,
+            'push': args.push,
             'interactive': args.interactive,
             'dry_run': args.dry_run,
             'verbose': args.verbose,
@@ -478,8 +935,12 @@ Examples:
             print(f"  {Colors.OKGREEN}📦 Method: {self.config['build_method']}{Colors.ENDC}")
             
             print(f"\n{Colors.BOLD}Next steps:{Colors.ENDC}")
-            print(f"  • Test the image: {Colors.OKCYAN}docker run --rm {self.config['tag']} --version{Colors.ENDC}")
-            print(f"  • Push to registry: {Colors.OKCYAN}docker push {self.config['tag']}{Colors.ENDC}")
+            if self.config['push']:
+                # The image went straight to the registry and is not in the local daemon
+                print(f"  • Pull the image: {Colors.OKCYAN}docker pull {self.config['tag']}{Colors.ENDC}")
+            else:
+                print(f"  • Test the image: {Colors.OKCYAN}docker run --rm {self.config['tag']} --version{Colors.ENDC}")
+                print(f"  • Push to registry: {Colors.OKCYAN}docker push {self.config['tag']}{Colors.ENDC}")
             print(f"  • Use in compose: {Colors.OKCYAN}CUSTOM_IMAGE={self.config['tag'].split(':')[0]} CUSTOM_TAG={self.config['tag'].split(':')[1]}{Colors.ENDC}")
         else:
             self._print_status("💥 Build Failed", "ERROR")
@@ -497,9 +958,9 @@ Examples:
             
             # Setup quiet mode
             if args.quiet:
-                self.logger.setLevel(logging.ERROR)
+                self.logger.setLevel('ERROR')
             elif args.verbose:
-                self.logger.setLevel(logging.DEBUG)
+                self.logger.setLevel('DEBUG')
             
             if not args.quiet:
                 self._print_banner()
@@ -515,12 +976,32 @@ Examples:
             if not self._validate_prerequisites():
                 sys.exit(1)
             
-            # Load apps configuration
-            apps_config = self._load_apps_config(self.config['apps_file'])
+            # Overlap image pulls with apps loading and setup
+            if not self.config['dry_run']:
+                self._start_prepull()
             
-            # Encode apps JSON
-            apps_json_str = json.dumps(apps_config, indent=2)
-            self.config['apps_json_base64'] = b64encode(apps_json_str.encode()).decode()
+            # Load apps configuration, reusing the encoded form if the file is unchanged
+            apps_cache_key = self._apps_cache_key(self.config['apps_file'])
+            cached_base64 = self._read_apps_cache(apps_cache_key) if apps_cache_key else None
+            if cached_base64 is not None:
+                self._print_status(f"✅ Using cached apps configuration from {self.config['apps_file']}", "SUCCESS")
+            else:
+                apps_config = self._load_apps_config(self.config['apps_file'])
+            
+            # Encode apps JSON (compact, the Containerfile only decodes it)
+            if self.config['dry_run']:
+                # The dry-run command is only printed, so skip the encoding work
+                self.config['apps_json_base64'] = '<DRY_RUN_PLACEHOLDER>'
+            elif cached_base64 is not None:
+                self.config['apps_json_base64'] = cached_base64
+            else:
+                if orjson:
+                    apps_json_bytes = orjson.dumps(apps_config)
+                else:
+                    apps_json_bytes = json.dumps(apps_config, separators=(',', ':')).encode()
+                self.config['apps_json_base64'] = b64encode(apps_json_bytes).decode()
+                if apps_cache_key:
+                    self._write_apps_cache(apps_cache_key, self.config['apps_json_base64'])
             
             # Print configuration summary
             if not self.config['quiet']:
@@ -529,6 +1010,9 @@ Examples:
             # Build Docker command
             cmd = self._build_docker_command()
             
+            # Check build context size
+            self._check_build_context()
+            
             # Execute build
             success = self._execute_build(cmd)
             